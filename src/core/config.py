@@ -9,6 +9,7 @@ from sys import argv, exit
 from pathlib import Path
 from typing import Union
 from core.validation.config import CONFIG_SCHEMA
+from core.validation.cache import get_cached_config, set_cached_config, get_config_stamp
 from core.utils.alert_dialog import raise_info_alert
 from cerberus import Validator, schema
 from yaml.parser import ParserError
@@ -32,10 +33,19 @@ class ConfigValidationError(TypeError):
         self.filepath = filepath
 
 
-try:
-    yaml_validator = Validator(CONFIG_SCHEMA)
-except schema.SchemaError:
-    logging.exception("Failed to load configuration schema for yaml validator.")
+_yaml_validator = None
+
+
+def get_yaml_validator() -> Validator:
+    # Built on first use so warm starts served from the validation cache never compile the schema
+    global _yaml_validator
+    if _yaml_validator is None:
+        try:
+            _yaml_validator = Validator(CONFIG_SCHEMA)
+        except schema.SchemaError:
+            logging.exception("Failed to load configuration schema for yaml validator.")
+            raise
+    return _yaml_validator
 
 
 def get_config_dir() -> str:
@@ -99,11 +109,19 @@ def get_config(show_error_dialog=False) -> Union[dict, None]:
     config_path = get_config_path()
 
     try:
+        cached_config = get_cached_config(config_path, CONFIG_SCHEMA)
+        if cached_config is not None:
+            return parse_env(cached_config)
+
+        config_stamp = get_config_stamp(config_path)
         with open(config_path, encoding='utf-8') as yaml_stream:
             config = safe_load(yaml_stream)
 
-        if yaml_validator.validate(config, CONFIG_SCHEMA):
-            return parse_env(yaml_validator.normalized(config))
+        yaml_validator = get_yaml_validator()
+        if yaml_validator.validate(config):
+            normalized_config = yaml_validator.normalized(config)
+            set_cached_config(config_path, CONFIG_SCHEMA, normalized_config, config_stamp)
+            return parse_env(normalized_config)
         else:
             pretty_errors = dump(yaml_validator.errors)
             logging.error(f"The config file '{config_path}' contains validation errors. Please fix:\n{pretty_errors}")
@@ -38,7 +38,7 @@ from core.utils.systray.win_wrappers import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class IconState:
     is_pinned: bool = False
     index: int = 0
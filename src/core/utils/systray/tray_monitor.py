@@ -9,7 +9,7 @@ from ctypes import (
     windll,
 )
 from ctypes.wintypes import MSG
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID
 
@@ -45,7 +45,9 @@ from core.utils.systray.utils import (
     pack_i32,
 )
 from core.utils.systray.win_types import (
+    CHILDID_SELF,
     COPYDATASTRUCT,
+    EVENT_OBJECT_DESTROY,
     NIF_GUID,
     NIF_ICON,
     NIF_INFO,
@@ -57,7 +59,11 @@ from core.utils.systray.win_types import (
     NIM_MODIFY,
     NIM_SETVERSION,
     NOTIFYICONDATA,
+    OBJID_WINDOW,
     SHELLTRAYDATA,
+    WINEVENT_OUTOFCONTEXT,
+    WINEVENT_SKIPOWNPROCESS,
+    WINEVENTPROC,
     WINNOTIFYICONIDENTIFIER,
     WNDCLASS,
     WNDPROC,
@@ -74,6 +80,8 @@ from core.utils.systray.win_wrappers import (
     SendNotifyMessage,
     SetTimer,
     SetWindowPos,
+    SetWinEventHook,
+    UnhookWinEvent,
 )
 from settings import DEBUG
 
@@ -90,7 +98,7 @@ gdi32 = windll.gdi32
 kernel32 = windll.kernel32
 
 
-@dataclass
+@dataclass(slots=True)
 class IconData:
     """Data class for validated systray icon data"""
 
@@ -112,6 +120,8 @@ class IconData:
     icon_image: QPixmap | None = None
     exe: str = ""
     exe_path: str = ""
+    # str(guid) memoized by SystrayWidget.update_icon_data when the guid is assigned
+    _guid_str: str | None = field(default=None, init=False, repr=False)
 
 
 class TrayMonitor(QObject):
@@ -119,13 +129,22 @@ class TrayMonitor(QObject):
 
     icon_modified = pyqtSignal(IconData)
     icon_deleted = pyqtSignal(IconData)
+    icon_window_destroyed = pyqtSignal(int)
 
     def __init__(self, parent: QObject | None = None):
         super().__init__(parent)
         self.hwnd: int = 0
         self.wc: WNDCLASS | None = None
+        # Windows that own tray icons, only touched from the monitor thread
+        self.icon_hwnds: set[int] = set()
+        self.win_event_proc = WINEVENTPROC(self._win_event_proc)
+        self.destroy_hook: int = 0
         atexit.register(self.destroy)
 
+    def is_destroy_hook_active(self) -> bool:
+        """Whether the monitor thread is currently notified of destroyed icon windows"""
+        return bool(self.destroy_hook)
+
     def run(self):
         # Register the window class
         wnd_class_name = "Shell_TrayWnd"
@@ -164,12 +183,31 @@ class TrayMonitor(QObject):
         # Set a timer to keep the window as a foreground window to keep receiving messages
         SetTimer(self.hwnd, 1, 100, None)
 
+        # Get notified when icon owner windows die instead of polling them. Out-of-context
+        # hooks are delivered through this thread's message loop below, our own menus and
+        # tooltips never own tray icons so their destruction is not even marshalled here
+        self.destroy_hook = SetWinEventHook(
+            EVENT_OBJECT_DESTROY,
+            EVENT_OBJECT_DESTROY,
+            None,
+            self.win_event_proc,
+            0,
+            0,
+            WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+        )
+        if not self.destroy_hook:
+            logger.debug("SetWinEventHook failed, relying on icon polling")
+
         # Run the message loop
         msg = MSG()
         while user32.GetMessageW(byref(msg), None, 0, 0) > 0:
             user32.TranslateMessage(byref(msg))
             user32.DispatchMessageW(byref(msg))
 
+        if self.destroy_hook:
+            UnhookWinEvent(self.destroy_hook)
+            self.destroy_hook = 0
+
     def __del__(self):
         """Ensure proper cleanup"""
         self.destroy()
@@ -211,6 +249,23 @@ class TrayMonitor(QObject):
             else:
                 return DefWindowProc(hwnd, uMsg, wParam, lParam)
 
+    def _win_event_proc(
+        self,
+        _hook: int,
+        _event: int,
+        hwnd: int | None,
+        id_object: int,
+        id_child: int,
+        _event_thread: int,
+        _event_time: int,
+    ) -> None:
+        """Forward the destruction of windows that own tray icons"""
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        if hwnd in self.icon_hwnds:
+            self.icon_hwnds.discard(hwnd)
+            self.icon_window_destroyed.emit(hwnd)
+
     def handle_copy_data(self, hwnd: int, uMsg: int, wParam: int, lParam: int) -> int:
         """Handles the WM_COPYDATA message"""
         copy_data = cast(lParam, POINTER(COPYDATASTRUCT)).contents
@@ -222,8 +277,11 @@ class TrayMonitor(QObject):
             if tray_message.message_type in {NIM_ADD, NIM_MODIFY, NIM_SETVERSION}:
                 validated_data = self.validate_icon_data(icon_data)
                 validated_data.message_type = tray_message.message_type
+                self.icon_hwnds.add(validated_data.hWnd)
                 self.icon_modified.emit(validated_data)
             elif tray_message.message_type == NIM_DELETE:
+                # Stop watching the owner so a reused hWnd doesn't report a stale icon window
+                self.icon_hwnds.discard(icon_data.hWnd)
                 self.icon_deleted.emit(
                     IconData(
                         hWnd=icon_data.hWnd,
@@ -48,6 +48,15 @@ NIN_CONTEXTMENU = 0x7B
 # Define the WNDPROC type
 WNDPROC = WINFUNCTYPE(LPARAM, HWND, UINT, WPARAM, LPARAM)
 
+# Define the WINEVENTPROC type
+WINEVENTPROC = WINFUNCTYPE(None, HANDLE, DWORD, HWND, LONG, LONG, DWORD, DWORD)
+
+EVENT_OBJECT_DESTROY = 0x8001
+WINEVENT_OUTOFCONTEXT = 0x0
+WINEVENT_SKIPOWNPROCESS = 0x2
+OBJID_WINDOW = 0x0
+CHILDID_SELF = 0x0
+
 
 # Set up the WNDCLASSEX structure
 class WNDCLASS(ct.Structure):
@@ -167,6 +167,26 @@ def IsWindow(hwnd: int) -> BOOL:
     return user32.IsWindow(hwnd)
 
 
+def SetWinEventHook(
+    eventMin: int,
+    eventMax: int,
+    hmodWinEventProc: int | None,
+    pfnWinEventProc: "ct._CFuncPtr",  # pyright: ignore [reportPrivateUsage]
+    idProcess: int,
+    idThread: int,
+    dwFlags: int,
+) -> int:
+    user32.SetWinEventHook.restype = HANDLE
+    user32.SetWinEventHook.argtypes = [DWORD, DWORD, HANDLE, LPVOID, DWORD, DWORD, DWORD]
+    return user32.SetWinEventHook(eventMin, eventMax, hmodWinEventProc, ct.cast(pfnWinEventProc, LPVOID), idProcess, idThread, dwFlags)
+
+
+def UnhookWinEvent(hWinEventHook: int) -> BOOL:
+    user32.UnhookWinEvent.restype = BOOL
+    user32.UnhookWinEvent.argtypes = [HANDLE]
+    return user32.UnhookWinEvent(hWinEventHook)
+
+
 def GetWindowThreadProcessId(hwnd: int, lpdwProcessId: "ct._CArgObject") -> int:  # pyright: ignore [reportPrivateUsage]
     user32.GetWindowThreadProcessId.restype = DWORD
     user32.GetWindowThreadProcessId.argtypes = [HWND, LPDWORD]
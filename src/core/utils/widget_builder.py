@@ -8,6 +8,17 @@ from importlib import import_module
 from core.utils.alert_dialog import raise_info_alert
 from settings import DEFAULT_CONFIG_FILENAME
 
+# Validators keyed by id() of the module-level VALIDATION_SCHEMA they were built from
+_widget_validators: dict[int, Validator] = {}
+
+
+def get_widget_validator(widget_schema: dict) -> Validator:
+    validator = _widget_validators.get(id(widget_schema))
+    if validator is None:
+        validator = Validator(widget_schema)
+        _widget_validators[id(widget_schema)] = validator
+    return validator
+
 
 class WidgetBuilder(QObject):
     def __init__(self, widget_configs: dict):
@@ -50,10 +61,10 @@ class WidgetBuilder(QObject):
                 if widget_event_listener:
                     self._widget_event_listeners.add(widget_event_listener)
 
-                widget_options_validator = Validator(widget_schema)
+                widget_options_validator = get_widget_validator(widget_schema)
                 widget_options = widget_config.get('options', {})
 
-                if not widget_options_validator.validate(widget_options, widget_schema):
+                if not widget_options_validator.validate(widget_options):
                     validation_errors = yaml.dump(widget_options_validator.errors)
                     indented_validation_errors = f"\n{validation_errors}".replace("\n", "\n      ")
                     self._invalid_widget_options[widget_name] = indented_validation_errors
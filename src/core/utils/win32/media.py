@@ -5,6 +5,8 @@ from typing import Any, Callable
 import asyncio
 
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from winsdk.windows.storage.streams import Buffer, InputStreamOptions, IRandomAccessStreamReference
 from PIL import Image, ImageFile
 import io
@@ -19,6 +21,7 @@ from winsdk.windows.media.control import (GlobalSystemMediaTransportControlsSess
 VK_MEDIA_PLAY_PAUSE = 0xB3
 VK_MEDIA_PREV_TRACK = 0xB1
 VK_MEDIA_NEXT_TRACK = 0xB0
+THUMBNAIL_CACHE_SIZE = 8
 
 # Make PIL logger not pollute logs
 pil_logger = logging.getLogger('PIL')
@@ -38,9 +41,14 @@ class WindowsMedia(metaclass=Singleton):
         self._current_session_lock = threading.RLock()
 
         self._event_loop = asyncio.new_event_loop()
+        # Requests coming from the GUI thread are served here, subscribers marshal results back via Qt signals
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WindowsMedia")
 
         self._media_info_lock = threading.RLock()
         self._media_info = None
+        self._media_update_state_lock = threading.Lock()
+        self._media_update_in_flight = False
+        self._media_update_pending = False
 
         self._playback_info_lock = threading.RLock()
         self._playback_info = None
@@ -48,6 +56,11 @@ class WindowsMedia(metaclass=Singleton):
         self._timeline_info_lock = threading.RLock()
         self._timeline_info = None
 
+        # Decoded thumbnails of recent tracks, keyed on (title, artist, album_title) and stored with the stream
+        # reference they were read from, since sources often announce a new track before its cover
+        self._thumbnail_cache_lock = threading.Lock()
+        self._thumbnail_cache: OrderedDict[tuple[str, str, str], tuple[IRandomAccessStreamReference, ImageFile]] = OrderedDict()
+
         self._subscription_channels = {channel: [] for channel in ['media_info', 'playback_info', 'timeline_info',
                                                                    'session_status']}
         self._subscription_channels_lock = threading.RLock()
@@ -56,7 +69,18 @@ class WindowsMedia(metaclass=Singleton):
         self._run_setup()
 
     def force_update(self):
-        self._on_current_session_changed(self._session_manager, None)
+        self._run_in_background(self._on_current_session_changed, self._session_manager, None)
+
+    def request_switch_session(self, direction: int):
+        self._run_in_background(self.switch_session, direction)
+
+    def _run_in_background(self, fn: Callable, *args):
+        def run():
+            try:
+                fn(*args)
+            except Exception as e:
+                self._log.error(f"Error in background media update: {e}")
+        self._executor.submit(run)
 
     def subscribe(self, callback: Callable, channel: str):
         with self._subscription_channels_lock:
@@ -74,6 +98,8 @@ class WindowsMedia(metaclass=Singleton):
         with self._current_session_lock:
             session = self._current_session
 
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
         # Remove all our subscriptions
         if session is not None:
             session.remove_media_properties_changed(self._registration_tokens['media_info'])
@@ -168,36 +194,73 @@ class WindowsMedia(metaclass=Singleton):
             for callback in callbacks:
                 callback(self._timeline_info)
 
-    @_current_session_only
     def _on_media_properties_changed(self, session: Session, args: MediaPropertiesChangedEventArgs):
         if DEBUG:
             self._log.debug('MediaCallback: _on_media_properties_changed')
-        
+
+        # Coalesce bursts (e.g. mashing next/prev) into the running update plus at most one follow-up.
+        # This is checked before taking the session lock, so events arriving during a fetch return right away
+        # instead of queueing on the lock and each running their own fetch once it is released
+        with self._media_update_state_lock:
+            if self._media_update_in_flight:
+                self._media_update_pending = True
+                return
+            self._media_update_in_flight = True
+
+        scheduled = False
+        try:
+            scheduled = self._process_media_properties(session)
+        finally:
+            if not scheduled:
+                self._finish_media_update()
+
+    @_current_session_only
+    def _process_media_properties(self, session: Session) -> bool:
+        """
+        Fetch the media properties of the session and notify subscribers.
+        Returns True if the update was scheduled on the running loop, which then finishes it itself.
+        """
         with self._media_info_lock:
             try:
                 try:
                     running_loop = asyncio.get_running_loop()
                     async def process_media_and_check():
-                        await self._update_media_properties(session)
-                        if self._media_info and self._is_media_info_empty(self._media_info):
-                            sessions = self._session_manager.get_sessions()
-                            if not any(self._are_same_sessions(sessions[i], self._current_session) for i in range(sessions.size)):
-                                self.switch_session(1)
-                    
+                        try:
+                            await self._update_media_properties(session)
+                            self._switch_session_if_empty()
+                        finally:
+                            self._finish_media_update()
+
                     running_loop.create_task(process_media_and_check())
-                    
+                    return True
+
                 except RuntimeError:
 
                     self._event_loop.run_until_complete(self._update_media_properties(session))
-                    
-                    if self._media_info and self._is_media_info_empty(self._media_info):
-                        sessions = self._session_manager.get_sessions()
-                        if not any(self._are_same_sessions(sessions[i], self._current_session) for i in range(sessions.size)):
-                            self.switch_session(1)
-                            
+                    self._switch_session_if_empty()
+
             except Exception as e:
                 self._log.error(f"Error in _on_media_properties_changed: {e}")
 
+        return False
+
+    def _finish_media_update(self):
+        with self._media_update_state_lock:
+            self._media_update_in_flight = False
+            run_again = self._media_update_pending
+            self._media_update_pending = False
+
+        if run_again:
+            with self._current_session_lock:
+                session = self._current_session
+            self._on_media_properties_changed(session, None)
+
+    def _switch_session_if_empty(self):
+        if self._media_info and self._is_media_info_empty(self._media_info):
+            sessions = self._session_manager.get_sessions()
+            if not any(self._are_same_sessions(sessions[i], self._current_session) for i in range(sessions.size)):
+                self.switch_session(1)
+
     @_current_session_only
     async def _update_media_properties(self, session: Session):
         if DEBUG:
@@ -209,7 +272,7 @@ class WindowsMedia(metaclass=Singleton):
             media_info = self._properties_2_dict(media_info)
 
             if media_info['thumbnail'] is not None:
-                media_info['thumbnail'] = await self.get_thumbnail(media_info['thumbnail'])
+                media_info['thumbnail'] = await self._get_cached_thumbnail(media_info)
 
         except Exception as e:
             self._log.error(f'MediaCallback: Error occurred whilst fetching media properties and thumbnail: {e}')
@@ -231,6 +294,32 @@ class WindowsMedia(metaclass=Singleton):
     def _properties_2_dict(obj) -> dict[str, Any]:
         return {name: getattr(obj, name) for name in dir(obj) if not name.startswith('_')}
 
+    async def _get_cached_thumbnail(self, media_info: dict[str, Any]) -> ImageFile:
+        """
+        Return the thumbnail for the track in media_info, reusing the decoded image only when the track was cached
+        from the same stream reference. Tracks without a title are never cached and a new reference for a cached
+        track is read again, a redundant read is preferred over showing the wrong cover.
+        """
+        stream_reference = media_info['thumbnail']
+        if not media_info['title']:
+            return await self.get_thumbnail(stream_reference)
+
+        key = (media_info['title'], media_info['artist'], media_info['album_title'])
+        with self._thumbnail_cache_lock:
+            cached = self._thumbnail_cache.get(key)
+            if cached is not None and cached[0] is stream_reference:
+                self._thumbnail_cache.move_to_end(key)
+                return cached[1]
+
+        thumbnail = await self.get_thumbnail(stream_reference)
+        if thumbnail is not None:
+            with self._thumbnail_cache_lock:
+                self._thumbnail_cache[key] = (stream_reference, thumbnail)
+                self._thumbnail_cache.move_to_end(key)
+                while len(self._thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+                    self._thumbnail_cache.popitem(last=False)
+        return thumbnail
+
     @staticmethod
     async def get_thumbnail(thumbnail_stream_reference: IRandomAccessStreamReference) -> ImageFile:
         """
@@ -0,0 +1,63 @@
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Union
+from settings import BUILD_VERSION
+
+VALIDATION_CACHE_PATH = Path(os.environ.get("LOCALAPPDATA", Path.home())) / "Yasb" / "validation.cache"
+
+
+def _schema_hash(schema: dict) -> str:
+    return hashlib.sha1(f"{BUILD_VERSION}{schema!r}".encode("utf-8")).hexdigest()
+
+
+def get_config_stamp(config_path: str) -> tuple[int, int]:
+    stat = os.stat(config_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cache() -> dict:
+    try:
+        with open(VALIDATION_CACHE_PATH, "rb") as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logging.debug("Discarding unreadable validation cache.")
+        return {}
+
+
+def get_cached_config(config_path: str, schema: dict) -> Union[dict, None]:
+    """
+    Return the normalized config stored for config_path if the file and
+    schema are unchanged since it was validated, otherwise None.
+    """
+    try:
+        entry = _read_cache().get(config_path)
+        if entry and entry["stamp"] == get_config_stamp(config_path) and entry["schema_hash"] == _schema_hash(schema):
+            return entry["config"]
+    except Exception:
+        logging.debug(f"Validation cache lookup failed for '{config_path}'.")
+    return None
+
+
+def set_cached_config(config_path: str, schema: dict, config: dict, stamp: tuple[int, int]) -> None:
+    """
+    Store a successfully validated and normalized config for config_path.
+    The stamp must be taken before the file was read so a concurrent edit is never cached as valid.
+    """
+    try:
+        cache = _read_cache()
+        cache[config_path] = {
+            "stamp": stamp,
+            "schema_hash": _schema_hash(schema),
+            "config": config
+        }
+        VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(VALIDATION_CACHE_PATH, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        logging.debug(f"Failed to update validation cache for '{config_path}'.")
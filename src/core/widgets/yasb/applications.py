@@ -2,13 +2,44 @@ import os
 from core.widgets.base import BaseWidget
 from core.validation.widgets.yasb.applications import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel, QHBoxLayout, QWidget
-from PyQt6.QtGui import QCursor, QPixmap
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QCursor, QPixmap, QPixmapCache, QImage, QImageReader
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 import subprocess
 import logging
 from core.utils.win32.system_function import function_map
 from core.utils.widgets.animation_manager import AnimationManager
 
+# Scaled app icons are shared through QPixmapCache so widget (re)creation skips decode + smooth scaling
+QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20480))
+
+ERROR_ELEVATION_REQUIRED = 740
+
+
+class IconSignals(QObject):
+    loaded = pyqtSignal(str, QImage)
+
+
+class IconLoader(QRunnable):
+    """Decodes and scales an app icon off the GUI thread. QImage is used because QPixmap is not thread-safe."""
+    def __init__(self, key: str, icon_path: str, size: int):
+        super().__init__()
+        self.key = key
+        self.icon_path = icon_path
+        self.size = size
+        self.signals = IconSignals()
+
+    def run(self):
+        reader = QImageReader(self.icon_path)
+        reader.setAutoTransform(True)
+        original_size = reader.size()
+        if original_size.isValid():
+            # Let the codec decode straight to the target size instead of full-res + downscale
+            reader.setScaledSize(original_size.scaled(self.size, self.size, Qt.AspectRatioMode.KeepAspectRatio))
+            image = reader.read()
+        else:
+            image = reader.read().scaled(self.size, self.size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        self.signals.loaded.emit(self.key, image)
+
 class ApplicationsWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
 
@@ -27,6 +58,7 @@ class ApplicationsWidget(BaseWidget):
         self._padding = container_padding
         self._image_icon_size = image_icon_size
         self._animation = animation
+        self._pending_icons: dict[str, list[QLabel]] = {}
         # Construct container
         self._widget_container_layout: QHBoxLayout = QHBoxLayout()
         self._widget_container_layout.setSpacing(0)
@@ -48,31 +80,80 @@ class ApplicationsWidget(BaseWidget):
                     label.setProperty("class", "label")
                     icon = app_data['icon']
                     if os.path.isfile(icon):
-                        pixmap = QPixmap(icon).scaled(self._image_icon_size, self._image_icon_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                        label.setPixmap(pixmap)
+                        self._load_icon(label, icon)
                     else:
                         label.setText(icon)
-                    label.data = app_data['launch']
+                    label.data = self._parse_launch(app_data['launch'])
                     self._widget_container_layout.addWidget(label)
         else:
             logging.error(f"Expected _apps to be a list but got {type(self._apps)}")
 
-    def execute_code(self, data):
+    def _load_icon(self, label: QLabel, icon: str):
+        key = f"apps:{icon}:{self._image_icon_size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            label.setPixmap(pixmap)
+            return
+        # Reserve the icon space until the worker delivers the decoded image
+        label.setMinimumSize(self._image_icon_size, self._image_icon_size)
+        if key in self._pending_icons:
+            self._pending_icons[key].append(label)
+            return
+        self._pending_icons[key] = [label]
+        loader = IconLoader(key, icon, self._image_icon_size)
+        loader.signals.loaded.connect(self._on_icon_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_icon_loaded(self, key: str, image: QImage):
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        for label in self._pending_icons.pop(key, []):
+            label.setMinimumSize(0, 0)
+            label.setPixmap(pixmap)
+
+    @staticmethod
+    def _parse_launch(launch: str) -> tuple[str, str]:
+        """Resolve the launch string once at build time into a (kind, value) pair for execute_code."""
+        if launch in function_map:
+            return ("function", launch)
+        if os.path.exists(launch) or ("://" in launch and " " not in launch):
+            return ("startfile", launch)
+        # Windows programs parse their own command line, so it is passed through untouched
+        return ("command", launch)
+
+    def execute_code(self, data: tuple[str, str]):
+        kind, value = data
         try:
-            if data in function_map:
-                function_map[data]()
-            else:    
+            if kind == "function":
+                function_map[value]()
+            elif kind == "startfile":
+                os.startfile(value)
+            else:
                 try:
-                    if not any(param in data for param in ['-new-tab', '-new-window','-private-window']):
-                        data = data.split()
-                    subprocess.Popen(data, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True)
+                    subprocess.Popen(
+                        value,
+                        shell=False,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                        close_fds=True
+                    )
+                except OSError as e:
+                    # Not an executable on PATH (most likely a shell builtin such as `start`) or a program that
+                    # needs elevation, cmd hands the latter to ShellExecute which shows the UAC prompt
+                    if isinstance(e, FileNotFoundError) or getattr(e, "winerror", None) == ERROR_ELEVATION_REQUIRED:
+                        subprocess.Popen(value, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, shell=True)
+                    else:
+                        logging.error(f"Error starting app: {str(e)}")
                 except Exception as e:
                     logging.error(f"Error starting app: {str(e)}")
         except Exception as e:
-            logging.error(f"Exception occurred: {str(e)} \"{data}\"")
- 
-        
+            logging.error(f"Exception occurred: {str(e)} \"{value}\"")
+
+
 class ClickableLabel(QLabel):
+    __slots__ = ("parent_widget", "data")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_widget = parent
@@ -1,13 +1,14 @@
 import logging
-from typing import Any, Optional
+import re
+import string
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Optional
 
 from PIL import Image
 from PIL.ImageDraw import ImageDraw
-from PIL.ImageQt import QPixmap
 from PyQt6 import QtCore
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QWheelEvent
-from PIL.ImageQt import ImageQt
+from PyQt6.QtGui import QWheelEvent, QImage, QPixmap
 from winsdk.windows.media.control import GlobalSystemMediaTransportControlsSessionPlaybackInfo
 
 from core.utils.win32.media import WindowsMedia
@@ -16,6 +17,9 @@ from core.validation.widgets.yasb.media import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel, QGridLayout, QHBoxLayout, QWidget
 from core.utils.widgets.animation_manager import AnimationManager
 
+_CONVERSIONS = {'r': 'repr', 's': 'str', 'a': 'ascii'}
+
+
 class MediaWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
 
@@ -44,8 +48,11 @@ class MediaWidget(BaseWidget):
         super().__init__(class_name="media-widget")
         self._label_content = label
         self._label_alt_content = label_alt
+        self._label_fields, self._format_label = self._compile_label_format(label)
+        self._label_alt_fields, self._format_label_alt = self._compile_label_format(label_alt)
 
         self._max_field_size = max_field_size
+        self._field_size_limit = max_field_size['label']
         self._show_thumbnail = show_thumbnail
         self._thumbnail_alpha = thumbnail_alpha
         self._media_button_icons = icons
@@ -118,6 +125,9 @@ class MediaWidget(BaseWidget):
 
         self._label_alt.hide()
         self._show_alt_label = False
+        self._last_button_states = None
+        # Recently rendered thumbnails keyed on (id(source), width, height); the source is kept so its id stays unique
+        self._thumbnail_cache: OrderedDict[tuple[int, int, int], tuple[Image.Image, QPixmap]] = OrderedDict()
 
         # Force media update to detect running session
         self.timer.singleShot(0, self.media.force_update)
@@ -126,6 +136,7 @@ class MediaWidget(BaseWidget):
         if self._animation['enabled']:
             AnimationManager.animate(self, self._animation['type'], self._animation['duration'])
         self._show_alt_label = not self._show_alt_label
+        self._field_size_limit = self._max_field_size['label_alt' if self._show_alt_label else 'label']
 
         if self._show_alt_label:
             self._label.hide()
@@ -134,8 +145,8 @@ class MediaWidget(BaseWidget):
             self._label.show()
             self._label_alt.hide()
 
-        # Force an update on the media info when toggling the label
-        self.media.force_update()
+        # Force an update on the media info when toggling the label, deferred so the toggle is painted first
+        self.timer.singleShot(0, self.media.force_update)
 
     def _toggle_play_pause(self):
         if self._animation['enabled']:
@@ -170,44 +181,60 @@ class MediaWidget(BaseWidget):
     def _on_playback_info_changed(self, playback_info: GlobalSystemMediaTransportControlsSessionPlaybackInfo):
         # Set play-pause state icon
         if not self._controls_hide:
-            self._play_label.setText(self._media_button_icons['pause' if playback_info.playback_status == 4 else 'play'])
-
-            # Update prev button
-            is_prev_enabled = playback_info.controls.is_previous_enabled
-            self._prev_label.setProperty("class", f"btn prev {'disabled' if not is_prev_enabled else ''}")
-            self._prev_label.setCursor(Qt.CursorShape.PointingHandCursor if is_prev_enabled else Qt.CursorShape.ArrowCursor)
-            
-            # Update play/pause button
-            is_play_enabled = playback_info.controls.is_play_pause_toggle_enabled
-            self._play_label.setProperty("class", f"btn play {'disabled' if not is_play_enabled else ''}")
-            self._play_label.setCursor(Qt.CursorShape.PointingHandCursor if is_play_enabled else Qt.CursorShape.ArrowCursor)
-            
-            # Update next button
-            is_next_enabled = playback_info.controls.is_next_enabled
-            self._next_label.setProperty("class", f"btn next {'disabled' if not is_next_enabled else ''}")
-            self._next_label.setCursor(Qt.CursorShape.PointingHandCursor if is_next_enabled else Qt.CursorShape.ArrowCursor)
-
-            # Refresh style sheets
-            self._prev_label.setStyleSheet('')
-            self._play_label.setStyleSheet('')
-            self._next_label.setStyleSheet('')
+            play_icon = self._media_button_icons['pause' if playback_info.playback_status == 4 else 'play']
+            if self._play_label.text() != play_icon:
+                self._play_label.setText(play_icon)
+
+            # Only restyle the buttons whose enabled state actually changed
+            controls = playback_info.controls
+            button_states = (controls.is_previous_enabled, controls.is_play_pause_toggle_enabled, controls.is_next_enabled)
+            if button_states == self._last_button_states:
+                return
+            last_states = self._last_button_states or (None, None, None)
+            buttons = ((self._prev_label, "prev"), (self._play_label, "play"), (self._next_label, "next"))
+            changed_buttons = []
+            for (button, name), is_enabled, was_enabled in zip(buttons, button_states, last_states):
+                if is_enabled == was_enabled:
+                    continue
+                button.setProperty("class", f"btn {name} {'disabled' if not is_enabled else ''}")
+                button.setCursor(Qt.CursorShape.PointingHandCursor if is_enabled else Qt.CursorShape.ArrowCursor)
+                changed_buttons.append(button)
+            self._refresh_css(changed_buttons)
+            self._last_button_states = button_states
+
+    def _refresh_css(self, labels: list[QLabel]):
+        # Repolish all changed buttons in one pass with the shared style
+        style = self._widget_container.style()
+        for label in labels:
+            style.unpolish(label)
+        for label in labels:
+            style.polish(label)
+            label.update()
 
     @QtCore.pyqtSlot(object) # None or dict
     def _on_media_properties_changed(self, media_info: Optional[dict[str, Any]]):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
+        active_format = self._format_label_alt if self._show_alt_label else self._format_label
 
         # If we only have controls, stop update here
         if self._controls_only:
             return
 
-        # Shorten fields if necessary with ...
-        media_info = {k: self._format_max_field_size(v) if isinstance(v, str) else v for k, v in
-                      media_info.items()}
+        # Only the fields used by the label are picked and shortened with ... if necessary
+        limit = self._field_size_limit
+        label_fields = self._label_alt_fields if self._show_alt_label else self._label_fields
+        label_values = {}
+        for field in label_fields:
+            value = media_info[field]
+            if isinstance(value, str) and len(value) > limit:
+                value = value[:limit - 3] + '...'
+            label_values[field] = value
 
         # Format the label
-        format_label_content = active_label_content.format(**media_info)
-        active_label.setText(format_label_content)
+        format_label_content = active_format(label_values)
+        # Skip the relayout when the text did not change
+        if active_label.text() != format_label_content:
+            active_label.setText(format_label_content)
 
         # If we don't want the thumbnail, stop here
         if not self._show_thumbnail:
@@ -221,8 +248,7 @@ class MediaWidget(BaseWidget):
         # Only update the thumbnail if the title/artist changes or if we did a toggle (resize)
         try:
             if media_info['thumbnail'] is not None:
-                thumbnail = self._crop_thumbnail(media_info['thumbnail'], active_label.sizeHint().width())
-                pixmap = QPixmap.fromImage(ImageQt(thumbnail))
+                pixmap = self._get_thumbnail_pixmap(media_info['thumbnail'], active_label.sizeHint().width())
                 self._thumbnail_label.setPixmap(pixmap)
         except Exception as e:
             logging.error(f'MediaWidget: Error setting thumbnail: {e}')
@@ -230,6 +256,62 @@ class MediaWidget(BaseWidget):
         else:
             self._thumbnail_label.show()
 
+    def _get_thumbnail_pixmap(self, thumbnail: Image, active_label_width: int) -> QPixmap:
+        key = (id(thumbnail), active_label_width, self._widget_frame.size().height())
+        cached = self._thumbnail_cache.get(key)
+        if cached is not None:
+            self._thumbnail_cache.move_to_end(key)
+            return cached[1]
+
+        pixmap = self._pil_to_pixmap(self._crop_thumbnail(thumbnail, active_label_width))
+        self._thumbnail_cache[key] = (thumbnail, pixmap)
+        if len(self._thumbnail_cache) > 4:
+            self._thumbnail_cache.popitem(last=False)
+        return pixmap
+
+    @staticmethod
+    def _compile_label_format(label: str) -> tuple[tuple[str, ...], Callable[[dict[str, Any]], str]]:
+        """
+        Parse the label template once and generate a function that builds the label by plain concatenation.
+        Templates with positional, attribute/index or nested fields fall back to str.format_map.
+        """
+        parts = []
+        fields = []
+        for literal, name, format_spec, conversion in string.Formatter().parse(label):
+            if literal:
+                parts.append(repr(literal))
+            if name is None:
+                continue
+            if not name.isidentifier() or '{' in format_spec:
+                return tuple(dict.fromkeys(MediaWidget._template_fields(label))), label.format_map
+            value = f"d[{name!r}]"
+            if conversion:
+                value = f"{_CONVERSIONS[conversion]}({value})"
+            parts.append(f"format({value}, {format_spec!r})")
+            fields.append(name)
+
+        builtins = {"format": format, "repr": repr, "str": str, "ascii": ascii}
+        format_label = eval(f"lambda d: {' + '.join(parts) or repr('')}", {"__builtins__": builtins})
+        return tuple(dict.fromkeys(fields)), format_label
+
+    @staticmethod
+    def _template_fields(template: str) -> Iterator[str]:
+        """Yield the top-level names of all fields in the template, including those nested in format specs."""
+        for _, name, format_spec, _ in string.Formatter().parse(template):
+            if name:
+                yield re.split(r'[.\[]', name, maxsplit=1)[0]
+            if format_spec:
+                yield from MediaWidget._template_fields(format_spec)
+
+    @staticmethod
+    def _pil_to_pixmap(image: Image) -> QPixmap:
+        # Qt's ARGB32 is BGRA in memory on little-endian, so PIL can hand over its buffer in one C-level copy
+        image = image.convert("RGBA")
+        data = image.tobytes("raw", "BGRA")
+        qimage = QImage(data, image.width, image.height, image.width * 4, QImage.Format.Format_ARGB32)
+        # Detach from the Python buffer before it is released
+        return QPixmap.fromImage(qimage.copy())
+
     def _crop_thumbnail(self, thumbnail: Image, active_label_width: int) -> Image:
         # Scale image with 1:1 ratio to fit width of widget
         new_width = active_label_width + self._thumbnail_padding
@@ -256,13 +338,6 @@ class MediaWidget(BaseWidget):
 
         return thumbnail
 
-    def _format_max_field_size(self, text: str):
-        max_field_size = self._max_field_size['label_alt' if self._show_alt_label else 'label']
-        if len(text) > max_field_size:
-            return text[:max_field_size - 3] + '...'
-        else:
-            return text
-
     def _create_media_button(self, icon, action):
         if not self._controls_hide:
             label = ClickableLabel(self)
@@ -286,11 +361,13 @@ class MediaWidget(BaseWidget):
 
     def wheelEvent(self, event: QWheelEvent):
         if event.angleDelta().y() > 0:
-            self.media.switch_session(+1) # Next
+            self.media.request_switch_session(+1) # Next
         elif event.angleDelta().y() < 0:
-            self.media.switch_session(-1) # Prev
+            self.media.request_switch_session(-1) # Prev
             
 class ClickableLabel(QLabel):
+    __slots__ = ("parent_widget", "data")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_widget = parent
@@ -3,6 +3,8 @@ import logging
 import os
 import re
 import threading
+import weakref
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, override
 from uuid import UUID
@@ -11,13 +13,13 @@ from PyQt6.QtCore import (
     QPoint,
     Qt,
     QThread,
+    QThreadPool,
     QTimer,
     pyqtSlot,  # pyright: ignore [reportUnknownVariableType]
 )
-from PyQt6.QtGui import QShowEvent
+from PyQt6.QtGui import QHideEvent, QScreen, QShowEvent
 from PyQt6.QtWidgets import (
     QApplication,
-    QHBoxLayout,
     QLayout,
     QMenu,
     QPushButton,
@@ -46,6 +48,12 @@ else:
     logger.setLevel(logging.CRITICAL)
 
 LOCALDATA_FOLDER = Path(os.environ["LOCALAPPDATA"]) / "Yasb"
+# Serializes state file writes between the GUI thread and the background writer
+STATE_FILE_LOCK = threading.Lock()
+NON_WORD_RE = re.compile(r"\W+")
+# Dead icon polling interval, relaxed once the tray monitor's window destroy hook is active
+ICON_CHECK_INTERVAL = 5000
+ICON_CHECK_INTERVAL_HOOKED = 60000
 
 BATTERY_ICON_GUID = UUID("7820ae75-23e3-4229-82c1-e41cb67d5b9c")
 VOLUME_ICON_GUID = UUID("7820ae73-23e3-4229-82c1-e41cb67d5b9c")
@@ -70,6 +78,13 @@ class SystrayWidget(BaseWidget):
     validation_schema: dict[str, dict[str, str | bool | int]] = VALIDATION_SCHEMA
     _instance = None
     _thread = None
+    _widgets: list[weakref.ref["SystrayWidget"]] = []
+    _icon_check_timer: QTimer | None = None
+    _PIN_MODIFIERS: dict[str, Qt.KeyboardModifier] = {
+        "ctrl": Qt.KeyboardModifier.ControlModifier,
+        "alt": Qt.KeyboardModifier.AltModifier,
+        "shift": Qt.KeyboardModifier.ShiftModifier,
+    }
 
     @classmethod
     def get_client_instance(cls):
@@ -115,25 +130,46 @@ class SystrayWidget(BaseWidget):
             self.filtered_guids.add(NETWORK_GUID)
 
         IconWidget.icon_size = icon_size
-        IconWidget.pin_modifier_key = {
-            "ctrl": Qt.KeyboardModifier.ControlModifier,
-            "alt": Qt.KeyboardModifier.AltModifier,
-            "shift": Qt.KeyboardModifier.ShiftModifier,
-        }.get(pin_click_modifier.lower(), Qt.KeyboardModifier.AltModifier)
+        IconWidget.pin_modifier_key = self._PIN_MODIFIERS.get(
+            pin_click_modifier.lower(), Qt.KeyboardModifier.AltModifier
+        )
 
         self.icons: list[IconWidget] = []
+        # Lookup indices for find_icon, kept in sync with self.icons
+        self._icons_by_guid: dict[UUID, IconWidget] = {}
+        self._icons_by_hwnd_uid: dict[tuple[int, int], IconWidget] = {}
         self.current_state: dict[str, IconState] = {}
         self.screen_id: str | None = None
-
-        # This timer will check if icons are still valid and have actual process attached
-        self.icon_check_timer = QTimer(self)
-        self.icon_check_timer.timeout.connect(self.check_icons)  # type: ignore
-        self.icon_check_timer.start(5000)
+        self._cached_screen: QScreen | None = None
+        self._file_baseline: dict[str, Any] = {}
+        self._file_baseline_path: Path | None = None
+        self._state_file_path: Path | None = None
+        self._state_file_screen_id: str | None = None
+        # Visible icons in the pinned layout, kept up to date by the handlers that move, hide or remove icons
+        self._pinned_visible_icons: set[IconWidget] = set()
+
+        # Dead icon windows are reported by the tray monitor's destroy hook, a single timer shared by all
+        # instances catches anything the hook may have missed and does all the work if the hook failed
+        SystrayWidget._widgets.append(weakref.ref(self))
+        if SystrayWidget._icon_check_timer is None:
+            SystrayWidget._icon_check_timer = QTimer()
+            SystrayWidget._icon_check_timer.timeout.connect(SystrayWidget.check_all_icons)  # type: ignore
+            SystrayWidget._icon_check_timer.start(ICON_CHECK_INTERVAL)
 
         self.sort_timer = QTimer(self)
         self.sort_timer.timeout.connect(self.sort_icons)  # type: ignore
         self.sort_timer.setSingleShot(True)
 
+        # Coalesces bursts of pin/move changes into a single state write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_state)  # type: ignore
+
+        # Coalesces container style refreshes into one per event loop pass
+        self._style_refresh_timer = QTimer(self)
+        self._style_refresh_timer.setSingleShot(True)
+        self._style_refresh_timer.timeout.connect(self._do_refresh_styles)  # type: ignore
+
         self.pinned_vis_check_timer = QTimer(self)
         self.pinned_vis_check_timer.timeout.connect(self.update_pinned_widget_visibility)  # type: ignore
         self.pinned_vis_check_timer.setSingleShot(True)
@@ -171,7 +207,13 @@ class SystrayWidget(BaseWidget):
 
         self.unpinned_vis_btn.setVisible(self.show_unpinned_button)
 
-        QTimer.singleShot(0, self.setup_client)  # pyright: ignore [reportUnknownMemberType]
+        app_inst = QApplication.instance()
+        if app_inst is not None:
+            app_inst.screenAdded.connect(self.invalidate_screen_id)  # type: ignore
+            app_inst.screenRemoved.connect(self.invalidate_screen_id)  # type: ignore
+
+        # The tray monitor is only started once the widget is first shown, see showEvent
+        self._client_connected = False
 
     def show_context_menu(self, pos: QPoint):
         """Show the context menu for the unpinned visibility button"""
@@ -206,13 +248,15 @@ class SystrayWidget(BaseWidget):
         client, thread = SystrayWidget.get_client_instance()
         client.icon_modified.connect(self.on_icon_modified)  # type: ignore
         client.icon_deleted.connect(self.on_icon_deleted)  # type: ignore
+        client.icon_window_destroyed.connect(self.on_icon_window_destroyed)  # type: ignore
 
         app_inst = QApplication.instance()
         if app_inst is not None:
             app_inst.aboutToQuit.connect(self.save_state)  # type: ignore
 
         if thread is not None and not thread.isRunning():
-            thread.start()
+            # Don't let the message loop compete with the GUI thread during startup
+            thread.start(QThread.Priority.LowPriority)
 
         # We need to send this message for each instance of the taskbar widget on init
         QTimer.singleShot(200, client.send_taskbar_created)  # pyright: ignore [reportUnknownMemberType]
@@ -221,10 +265,22 @@ class SystrayWidget(BaseWidget):
     def showEvent(self, a0: QShowEvent | None) -> None:
         """Called when the widget is shown on the screen"""
         super().showEvent(a0)
+        if not self._client_connected:
+            self._client_connected = True
+            QTimer.singleShot(0, self.setup_client)  # pyright: ignore [reportUnknownMemberType]
         self.unpinned_vis_btn.setChecked(self.show_unpinned)
         self.unpinned_vis_btn.setText(self.label_expanded if self.show_unpinned else self.label_collapsed)
         self.unpinned_widget.setVisible(self.show_unpinned or not self.show_unpinned_button)
 
+    @override
+    def hideEvent(self, a0: QHideEvent | None) -> None:
+        """Called when the widget is hidden, also when its bar is closed or destroyed"""
+        super().hideEvent(a0)
+        # A debounced save would die with the widget, so write it right away
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_state()
+
     @pyqtSlot()
     def on_drag_started(self):
         """Handle drag started signal for drag-and-drop functionality"""
@@ -269,9 +325,12 @@ class SystrayWidget(BaseWidget):
 
             # After a short delay (if no new icons are added) - re-sort the icons once
             self.sort_timer.start(1000)
+        self.unindex_icon(icon)
         self.update_icon_data(icon.data, data)
+        self.index_icon(icon)
         icon.update_icon()
         icon.setHidden(data.uFlags & NIF_STATE != 0 and data.dwState == 1)
+        self.update_pinned_visible(icon)
         self.pinned_vis_check_timer.start(300)
 
     @pyqtSlot(IconData)
@@ -279,8 +338,16 @@ class SystrayWidget(BaseWidget):
         """Handles the icon deleted signal sent by the tray monitor"""
         icon = self.find_icon(data.guid, data.hWnd, data.uID)
         if icon is not None:
-            self.icons.remove(icon)
-            icon.deleteLater()
+            self.remove_icon(icon)
+            self.pinned_vis_check_timer.start(300)
+
+    @pyqtSlot(int)
+    def on_icon_window_destroyed(self, hwnd: int) -> None:
+        """Handles the destruction of a window owning one or more tray icons"""
+        dead_icons = [icon for icon in self.icons if icon.data is not None and icon.data.hWnd == hwnd]
+        for icon in dead_icons:
+            self.remove_icon(icon)
+        if dead_icons:
             self.pinned_vis_check_timer.start(300)
 
     @pyqtSlot(object)
@@ -296,9 +363,9 @@ class SystrayWidget(BaseWidget):
         # otherwise, the widget will not show up in the layout immediately
         # and update_current_state will fail
         icon.show()
-        self.unpinned_widget.refresh_styles()
-        self.pinned_widget.refresh_styles()
-        self.save_state()
+        self.update_pinned_visible(icon)
+        self._style_refresh_timer.start(0)
+        self._save_timer.start(500)
         self.update_pinned_widget_visibility()
 
     @pyqtSlot(object)
@@ -308,31 +375,76 @@ class SystrayWidget(BaseWidget):
             icon.is_pinned = False
         else:
             icon.is_pinned = True
+        # The drop already emitted drag_ended, so the visibility is updated again with the new count
+        self.update_pinned_visible(icon)
+        self.update_pinned_widget_visibility()
+        self._style_refresh_timer.start(0)
+        self._save_timer.start(500)
+
+    def _do_refresh_styles(self):
+        """Refresh the styles of both icon containers"""
         self.unpinned_widget.refresh_styles()
         self.pinned_widget.refresh_styles()
-        self.save_state()
 
     def find_icon(self, uuid: UUID | None, hwnd: int, uID: int) -> IconWidget | None:
         """Find an icon by its uuid or hwnd and uID"""
-        if uuid is not None:
-            for icon in self.icons:
-                if icon.data is None or icon.data.guid is None:
-                    continue
-                if icon.data.guid == uuid:
-                    return icon
-        for icon in self.icons:
-            if icon.data is None:
+        if uuid is not None and (icon := self._icons_by_guid.get(uuid)) is not None:
+            return icon
+        return self._icons_by_hwnd_uid.get((hwnd, uID))
+
+    def index_icon(self, icon: IconWidget):
+        """Register the icon in the lookup indices under its current guid and (hWnd, uID)"""
+        if icon.data is None:
+            return
+        if icon.data.guid is not None:
+            self._icons_by_guid[icon.data.guid] = icon
+        self._icons_by_hwnd_uid[(icon.data.hWnd, icon.data.uID)] = icon
+
+    def unindex_icon(self, icon: IconWidget):
+        """Remove the icon from the lookup indices, leaving entries that belong to other icons"""
+        if icon.data is None:
+            return
+        if icon.data.guid is not None and self._icons_by_guid.get(icon.data.guid) is icon:
+            del self._icons_by_guid[icon.data.guid]
+        hwnd_uid = (icon.data.hWnd, icon.data.uID)
+        if self._icons_by_hwnd_uid.get(hwnd_uid) is icon:
+            del self._icons_by_hwnd_uid[hwnd_uid]
+
+    def remove_icon(self, icon: IconWidget):
+        """Remove the icon from the widget and schedule it for deletion"""
+        self.icons.remove(icon)
+        self.unindex_icon(icon)
+        self._pinned_visible_icons.discard(icon)
+        icon.deleteLater()
+
+    @classmethod
+    def check_all_icons(cls):
+        """Run check_icons once for every live systray widget"""
+        alive: list[weakref.ref[SystrayWidget]] = []
+        for ref in cls._widgets:
+            widget = ref()
+            if widget is None:
+                continue
+            try:
+                widget.check_icons()
+            except RuntimeError:
+                # The underlying C++ widget has already been deleted
                 continue
-            if icon.data.hWnd == hwnd and icon.data.uID == uID:
-                return icon
+            alive.append(ref)
+        cls._widgets = alive
+
+        # Only poll slowly once the monitor is actually watching for destroyed windows
+        hooked = cls._instance is not None and cls._instance.is_destroy_hook_active()
+        interval = ICON_CHECK_INTERVAL_HOOKED if hooked else ICON_CHECK_INTERVAL
+        if cls._icon_check_timer is not None and cls._icon_check_timer.interval() != interval:
+            cls._icon_check_timer.setInterval(interval)
 
     def check_icons(self):
         """Check if any icons are still valid and have actual process attached"""
         icons_changed = False
         for icon in self.icons[:]:
             if icon.data is not None and not IsWindow(icon.data.hWnd):
-                self.icons.remove(icon)
-                icon.deleteLater()
+                self.remove_icon(icon)
                 icons_changed = True
 
         if icons_changed:
@@ -343,57 +455,57 @@ class SystrayWidget(BaseWidget):
         if old_data is None:
             return
 
-        direct_attributes = [
-            "message_type",
-            "hWnd",
-            "uID",
-            "uFlags",
-            "icon_image",
-            "exe",
-            "exe_path",
-        ]
-        for attr in direct_attributes:
-            setattr(old_data, attr, getattr(new_data, attr))
+        old_data.message_type = new_data.message_type
+        old_data.hWnd = new_data.hWnd
+        old_data.uID = new_data.uID
+        old_data.uFlags = new_data.uFlags
+        old_data.icon_image = new_data.icon_image
+        old_data.exe = new_data.exe
+        old_data.exe_path = new_data.exe_path
 
         if 0 < new_data.uVersion <= 4:
             old_data.uVersion = new_data.uVersion
 
-        flag_dependent_attrs = {
-            NIF_MESSAGE: ["uCallbackMessage"],
-            NIF_ICON: ["hIcon"],
-            NIF_TIP: ["szTip"],
-            NIF_STATE: ["dwState", "dwStateMask"],
-            NIF_GUID: ["guid"],
-            NIF_INFO: ["dwInfoFlags", "szInfoTitle", "szInfo", "uTimeout"],
-        }
-
-        for flag, attrs in flag_dependent_attrs.items():
-            if new_data.uFlags & flag:
-                for attr in attrs:
-                    setattr(old_data, attr, getattr(new_data, attr))
-
-    def is_layout_empty(self, layout: QHBoxLayout):
-        """Check if a layout has any visible widgets."""
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item and (w := item.widget()) and not w.isHidden():
-                return False
-        return True
+        flags = new_data.uFlags
+        if flags & NIF_MESSAGE:
+            old_data.uCallbackMessage = new_data.uCallbackMessage
+        if flags & NIF_ICON:
+            old_data.hIcon = new_data.hIcon
+        if flags & NIF_TIP:
+            old_data.szTip = new_data.szTip
+        if flags & NIF_STATE:
+            old_data.dwState = new_data.dwState
+            old_data.dwStateMask = new_data.dwStateMask
+        if flags & NIF_GUID:
+            old_data.guid = new_data.guid
+            old_data._guid_str = str(new_data.guid) if new_data.guid is not None else None
+        if flags & NIF_INFO:
+            old_data.dwInfoFlags = new_data.dwInfoFlags
+            old_data.szInfoTitle = new_data.szInfoTitle
+            old_data.szInfo = new_data.szInfo
+            old_data.uTimeout = new_data.uTimeout
+
+    def update_pinned_visible(self, icon: IconWidget):
+        """Track whether the icon currently counts as a visible pinned icon"""
+        if icon.parent() is self.pinned_widget and not icon.isHidden():
+            self._pinned_visible_icons.add(icon)
+        else:
+            self._pinned_visible_icons.discard(icon)
 
     def update_pinned_widget_visibility(self, force_show: bool = False):
         """
         Update the visibility of the pinned widget based on its content.
         If force_show is True, the widget will be shown regardless of content.
         """
-        is_empty = self.is_layout_empty(self.pinned_layout)
+        is_empty = not self._pinned_visible_icons
         self.pinned_widget.setVisible(not is_empty or force_show)
         if force_show and is_empty and (w := self.pinned_widget.style()):
-            logger.debug(f"Is empty: {is_empty}, force show: {force_show}")
+            logger.debug("Is empty: %s, force show: %s", is_empty, force_show)
             self.pinned_widget.setProperty("forceshow", True)
             w.unpolish(self.pinned_widget)
             w.polish(self.pinned_widget)
         elif self.pinned_widget.property("forceshow") and not is_empty and (w := self.pinned_widget.style()):
-            logger.debug(f"Is empty: {is_empty}, force show: {force_show}")
+            logger.debug("Is empty: %s, force show: %s", is_empty, force_show)
             self.pinned_widget.setProperty("forceshow", False)
             w.unpolish(self.pinned_widget)
             w.polish(self.pinned_widget)
@@ -416,31 +528,32 @@ class SystrayWidget(BaseWidget):
         def get_sort_index(widget: IconWidget):
             if widget.data is None:
                 return 9999
-            if widget.data.guid is not None:
-                index = self.current_state.get(str(widget.data.guid))
-            else:
-                index = self.current_state.get(widget.data.exe_path)
+            index = self.current_state.get(widget.data._guid_str or widget.data.exe_path)
             return index.index if index is not None else 9999
 
-        unpinned.sort(key=get_sort_index)
-        pinned.sort(key=get_sort_index)
-        for w in unpinned:
-            self.unpinned_layout.insertWidget(unpinned.index(w), w)
-        for w in pinned:
-            self.pinned_layout.insertWidget(pinned.index(w), w)
-        self.update_current_state()
-
-    def update_current_state(self):
+        # Compute each key once, then re-insert the widgets in their sorted order
+        # and record the new indices so update_current_state doesn't walk the layouts again
+        index_map: dict[IconWidget, int] = {}
+        for layout, widgets in ((self.unpinned_layout, unpinned), (self.pinned_layout, pinned)):
+            decorated = [(get_sort_index(w), w) for w in widgets]
+            decorated.sort(key=itemgetter(0))
+            for _, w in decorated:
+                layout.removeWidget(w)
+            for i, (_, w) in enumerate(decorated):
+                layout.insertWidget(i, w)
+                index_map[w] = i
+        self.update_current_state(index_map)
+
+    def update_current_state(self, index_map: dict[IconWidget, int] | None = None):
         logger.debug("Updating current state")
         widgets_state: dict[str, Any] = {}
+        if index_map is None:
+            index_map = self.get_layout_index_map()
         for w in self.icons:
             if w.data is None or w.isHidden():
                 continue
-            index = self.unpinned_layout.indexOf(w)
-            if index == -1:
-                index = self.pinned_layout.indexOf(w)
-            uuid = None if w.data.guid is None else str(w.data.guid)
-            widgets_state[uuid or w.data.exe_path] = IconState(
+            index = index_map.get(w, -1)
+            widgets_state[w.data._guid_str or w.data.exe_path] = IconState(
                 is_pinned=w.is_pinned,
                 index=index,
             )
@@ -448,51 +561,107 @@ class SystrayWidget(BaseWidget):
 
     def save_state(self):
         """Save the current icon position and pinned state to disk."""
-        self.update_current_state()
-        logger.debug("Saving state to disk")
-        if not LOCALDATA_FOLDER.exists():
-            LOCALDATA_FOLDER.mkdir(parents=True, exist_ok=True)
+        file_path, state = self._snapshot_state()
+        self._write_state_to_disk(file_path, state)
 
-        self.get_screen_id()
-        file_path = LOCALDATA_FOLDER / Path(f"systray_state_{self.screen_id}.json")
-        logger.debug(f"Saving state to {file_path}")
-        saved_state: dict[str, Any] = {}
+    def _flush_state(self):
+        """Save the state on a worker thread once a burst of changes has settled."""
+        file_path, state = self._snapshot_state()
+        QThreadPool.globalInstance().start(lambda: self._write_state_to_disk(file_path, state))  # type: ignore
+
+    def _snapshot_state(self) -> tuple[Path, dict[str, Any]]:
+        """Update the current state on the GUI thread and return the full file contents with the target file."""
+        self.update_current_state()
+        file_path = self.get_state_file_path()
+        if file_path != self._file_baseline_path:
+            # The screen changed since the state was loaded, pick up what is already saved for the new one
+            self._file_baseline = self._read_state_file(file_path)
+            self._file_baseline_path = file_path
+        # Merging the entries loaded from disk with current state, nothing else writes this file in between
+        current = {k: {"is_pinned": v.is_pinned, "index": v.index} for k, v in self.current_state.items()}
+        new_state = self._file_baseline | current
+        self._file_baseline = new_state
+        return file_path, new_state
+
+    @staticmethod
+    def _read_state_file(file_path: Path) -> dict[str, Any]:
+        """Read the raw state file, returning an empty state if it is missing or corrupt."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                saved_state = json.load(f)
+            # json accepts UTF-8 bytes directly, no need for the text layer
+            return json.loads(file_path.read_bytes())
         except json.JSONDecodeError:
             logger.debug("State file decode error. Ignoring.")
         except FileNotFoundError:
             logger.debug("State file not found.")
-        # Merging the saved state with current state before saving it to disk
-        new_state = saved_state | {k: v.__dict__ for k, v in self.current_state.items()}
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(new_state, indent=2))
+        return {}
+
+    @staticmethod
+    def _write_state_to_disk(file_path: Path, new_state: dict[str, Any]):
+        """Write the state file, safe to call from any thread."""
+        with STATE_FILE_LOCK:
+            logger.debug("Saving state to disk")
+            logger.debug("Saving state to %s", file_path)
+            # Compact output, nobody reads this file by hand and indenting doubles its size
+            payload = json.dumps(new_state, separators=(",", ":")).encode("utf-8")
+            # Write next to the target and swap it in so a crash mid-write never leaves a truncated file
+            tmp_path = file_path.with_suffix(".json.tmp")
+            try:
+                LOCALDATA_FOLDER.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, file_path)
+            except OSError as e:
+                # Runs on a worker thread, an escaping error would take the whole app down through the excepthook.
+                # os.replace fails e.g. while a scanner holds the file open, the next save will try again
+                logger.error("Failed to save systray state to %s: %s", file_path, e)
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
 
     def load_state(self):
         """Load the saved icon position and pinned state from disk."""
-        self.get_screen_id()
-        file_path = LOCALDATA_FOLDER / Path(f"systray_state_{self.screen_id}.json")
-        logger.debug(f"Loading state from {file_path}")
+        file_path = self.get_state_file_path()
+        logger.debug("Loading state from %s", file_path)
         self.current_state = {}
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
-                for k, v in state.items():
-                    self.current_state[k] = IconState.from_dict(v)
-        except json.JSONDecodeError:
-            logger.debug("State file decode error. Ignoring.")
-        except FileNotFoundError:
-            logger.debug("State file not found.")
+        self._file_baseline = self._read_state_file(file_path)
+        self._file_baseline_path = file_path
+        for k, v in self._file_baseline.items():
+            self.current_state[k] = IconState.from_dict(v)
+
+    def get_state_file_path(self) -> Path:
+        """Get the state file path for the current screen, rebuilt only when the screen id changes"""
+        self.get_screen_id()
+        screen_id = self.screen_id
+        if self._state_file_path is None or screen_id != self._state_file_screen_id:
+            self._state_file_path = LOCALDATA_FOLDER / f"systray_state_{screen_id}.json"
+            self._state_file_screen_id = screen_id
+        return self._state_file_path
 
     def get_screen_id(self):
         """Get the screen id for the current systray widget instance"""
         screen = self.screen()
         if screen is not None:
+            if screen is self._cached_screen and self.screen_id is not None:
+                return self.screen_id
             raw_id = f"{screen.manufacturer()}{screen.name()}{screen.serialNumber()}".upper()
-            self.screen_id = re.sub(r"\W+", "", raw_id)
+            self.screen_id = NON_WORD_RE.sub("", raw_id)
+            self._cached_screen = screen
             return self.screen_id
 
+    def invalidate_screen_id(self, *_: Any):
+        """Force the screen id to be recomputed after the screen configuration changed"""
+        self._cached_screen = None
+
+    def get_layout_index_map(self) -> dict[IconWidget, int]:
+        """Map every icon in the pinned and unpinned layouts to its index in its layout."""
+        index_map: dict[IconWidget, int] = {}
+        for layout in (self.unpinned_layout, self.pinned_layout):
+            for i in range(layout.count()):
+                item = layout.itemAt(i)
+                if item is not None and (w := item.widget()) and isinstance(w, IconWidget):
+                    index_map[w] = i
+        return index_map
+
     def get_widgets_from_layout(self, layout: QLayout) -> list[IconWidget]:
         """Get all the widgets from a layout."""
         widgets: list[IconWidget] = []
@@ -1,6 +1,7 @@
 import logging
 import re
 import socket
+import sys
 from winsdk.windows.networking.connectivity import NetworkInformation, NetworkConnectivityLevel
 from core.widgets.base import BaseWidget
 from core.validation.widgets.yasb.wifi import VALIDATION_SCHEMA
@@ -23,7 +24,8 @@ class WifiWidget(BaseWidget):
         callbacks: dict[str, str],
     ):
         super().__init__(update_interval, class_name="wifi-widget")
-        self._wifi_icons = wifi_icons
+        # Interned tuple, picked by signal bar index on every update
+        self._wifi_icons = tuple(map(sys.intern, wifi_icons))
         self._ethernet_icon = ethernet_icon
 
         self._show_alt_label = False
@@ -160,13 +162,5 @@ class WifiWidget(BaseWidget):
 
     def _get_wifi_icon(self):
         strength = self._get_wifi_strength()
-        if strength == 0:
-            return self._wifi_icons[0], strength
-        elif strength == 1:
-            return self._wifi_icons[1], strength * 25
-        elif strength == 2:
-            return self._wifi_icons[2], strength * 25
-        elif strength == 3:
-            return self._wifi_icons[3], strength * 25
-        elif strength == 4:
-            return self._wifi_icons[4], strength * 25
+        if 0 <= strength <= 4:
+            return self._wifi_icons[strength], strength * 25